@@ -8,10 +8,14 @@ No inheritance from the port is needed — this class satisfies the protocol
 through structural typing (duck typing with type safety).
 """
 
+from collections.abc import Iterable
 from uuid import UUID
 
 from example_app.domain.models.example_entity import ExampleEntity
 
+# Sentinel for dict.pop() so a delete takes a single hash-table probe.
+_MISSING = object()
+
 
 class InMemoryExampleEntityRepository:
     """
@@ -26,17 +30,25 @@ class InMemoryExampleEntityRepository:
     This class implicitly satisfies the protocol through structural typing.
     """
 
+    __slots__ = ("_storage",)
+
     def __init__(self) -> None:
-        self._storage: dict[UUID, ExampleEntity] = {}
+        # Keyed by ``UUID.int``: hashing a plain int is done in C, whereas
+        # hashing a UUID goes through the Python-level ``UUID.__hash__``.
+        self._storage: dict[int, ExampleEntity] = {}
 
     def save(self, entity: ExampleEntity) -> ExampleEntity:
         """Save an entity to the in-memory storage."""
-        self._storage[entity.id] = entity
+        self._storage[entity.id.int] = entity
         return entity
 
+    def save_many(self, entities: Iterable[ExampleEntity]) -> None:
+        """Save several entities at once. Useful for seeding test data."""
+        self._storage.update([(entity.id.int, entity) for entity in entities])
+
     def find_by_id(self, entity_id: UUID) -> ExampleEntity | None:
         """Retrieve an entity by its ID."""
-        return self._storage.get(entity_id)
+        return self._storage.get(entity_id.int)
 
     def find_all(self) -> list[ExampleEntity]:
         """Retrieve all entities from the storage."""
@@ -44,14 +56,18 @@ class InMemoryExampleEntityRepository:
 
     def delete(self, entity_id: UUID) -> bool:
         """Delete an entity by its ID. Returns True if deleted, False if not found."""
-        if entity_id in self._storage:
-            del self._storage[entity_id]
-            return True
-        return False
+        return self._storage.pop(entity_id.int, _MISSING) is not _MISSING
 
     def exists(self, entity_id: UUID) -> bool:
         """Check if an entity with the given ID exists."""
-        return entity_id in self._storage
+        return entity_id.int in self._storage
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Support ``entity_id in repository`` as a shortcut for exists().
+
+        Anything that is not a UUID (e.g. an entity) is never contained.
+        """
+        return isinstance(entity_id, UUID) and entity_id.int in self._storage
 
     def clear(self) -> None:
         """Clear all entities from storage. Useful for test cleanup."""
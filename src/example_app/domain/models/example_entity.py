@@ -5,12 +5,31 @@ Domain entities represent core business concepts with identity.
 They encapsulate business logic and are independent of any infrastructure concerns.
 """
 
+import sys
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Optional
+from itertools import count
+from typing import ClassVar
 from uuid import UUID, uuid4
 
+# Shared by every use_sequential_ids() call, so toggling id sources never
+# reissues a sequential id.
+_sequential_ids = count(1)
 
-@dataclass
+# With use_interned_names(), names shorter than this are interned so entities
+# sharing a name share one string object. Longer strings are left alone.
+_INTERN_MAX_LEN = 64
+
+
+def _intern_name(name: str) -> str:
+    """Intern short names so equal names share a single string object."""
+    # sys.intern() rejects str subclasses (e.g. StrEnum members).
+    if type(name) is str and len(name) < _INTERN_MAX_LEN:
+        return sys.intern(name)
+    return name
+
+
+@dataclass(init=False, eq=False)
 class ExampleEntity:
     """
     An example domain entity.
@@ -24,12 +43,31 @@ class ExampleEntity:
     Replace this with your actual domain entities.
     """
 
+    # Declared by hand instead of slots=True so the hash cache gets a slot
+    # without becoming a dataclass field (fields(), asdict(), repr).
+    __slots__ = ("_hash", "_hashed_id", "description", "id", "name")
+
     id: UUID
     name: str
-    description: Optional[str] = None
+    description: str | None
+
+    # Identity source used by create(); see use_sequential_ids().
+    _id_factory: ClassVar[Callable[[], UUID]] = uuid4
+    # Whether names are interned; see use_interned_names().
+    _intern_names: ClassVar[bool] = False
+
+    def __init__(self, id: UUID, name: str, description: str | None = None) -> None:
+        # Hand-written (init=False) so the identity hash is cached inline
+        # instead of in a __post_init__ call. hash(UUID) == hash(UUID.int),
+        # and hashing the int skips the Python-level UUID.__hash__.
+        self.id = id
+        self.name = _intern_name(name) if self._intern_names else name
+        self.description = description
+        self._hash = hash(id.int)
+        self._hashed_id = id
 
     @classmethod
-    def create(cls, name: str, description: Optional[str] = None) -> "ExampleEntity":
+    def create(cls, name: str, description: str | None = None) -> "ExampleEntity":
         """
         Factory method to create a new entity with a generated ID.
 
@@ -40,11 +78,56 @@ class ExampleEntity:
         Returns:
             A new ExampleEntity instance
         """
-        return cls(
-            id=uuid4(),
-            name=name,
-            description=description,
-        )
+        # Positional call: cheaper than passing keyword arguments.
+        return cls(cls._id_factory(), name, description)
+
+    @classmethod
+    def use_sequential_ids(cls, start: int | None = None) -> None:
+        """
+        Make create() issue ids from an in-process counter instead of uuid4().
+
+        The ids are still UUIDs, built from consecutive integers. They come
+        from one process-wide counter that survives switching between
+        sequential and random ids, so toggling never reissues an id. Passing
+        start restarts that counter, which can reissue ids handed out by an
+        earlier sequential run. Meant for tests and prototyping, where
+        avoiding the random-source read speeds up bulk entity creation.
+        Call use_random_ids() to switch back.
+
+        Args:
+            start: Restart the counter at this integer value; by default it
+                continues where the previous sequential run stopped
+
+        Raises:
+            ValueError: If start is outside the 128-bit UUID range
+        """
+        global _sequential_ids
+        if start is not None:
+            if not 0 <= start < 1 << 128:
+                raise ValueError(f"start must be in [0, 2**128), got {start}")
+            _sequential_ids = count(start)
+        counter = _sequential_ids
+        cls._id_factory = lambda: UUID(int=next(counter))
+
+    @classmethod
+    def use_random_ids(cls) -> None:
+        """Make create() issue random uuid4() ids again (the default)."""
+        cls._id_factory = uuid4
+
+    @classmethod
+    def use_interned_names(cls, enabled: bool = True) -> None:
+        """
+        Make entities intern their names with sys.intern().
+
+        Off by default: interning costs time on every construction, and only
+        pays off in memory when many entities share a small set of short
+        names. Names of 64 characters or more, and str subclasses such as
+        StrEnum members, are always stored as given.
+
+        Args:
+            enabled: Whether new and renamed entities intern their names
+        """
+        cls._intern_names = enabled
 
     def update_name(self, new_name: str) -> "ExampleEntity":
         """
@@ -56,18 +139,29 @@ class ExampleEntity:
         Returns:
             A new ExampleEntity instance with the updated name
         """
-        return ExampleEntity(
-            id=self.id,
-            name=new_name,
-            description=self.description,
-        )
+        # The id is unchanged, so skip __init__ and copy the cached hash
+        # rather than recomputing it.
+        entity = object.__new__(ExampleEntity)
+        entity.id = self.id
+        entity.name = _intern_name(new_name) if self._intern_names else new_name
+        entity.description = self.description
+        entity._hash = self._hash
+        entity._hashed_id = self._hashed_id
+        return entity
 
     def __eq__(self, other: object) -> bool:
         """Entities are equal if they have the same identity."""
+        if other is self:
+            return True
         if not isinstance(other, ExampleEntity):
             return False
         return self.id == other.id
 
     def __hash__(self) -> int:
         """Hash based on identity."""
-        return hash(self.id)
+        # The cache remembers which id object it was computed from, so
+        # reassigning id never leaves a stale hash behind.
+        if self._hashed_id is not self.id:
+            self._hash = hash(self.id.int)
+            self._hashed_id = self.id
+        return self._hash
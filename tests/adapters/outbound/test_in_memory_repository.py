@@ -135,6 +135,39 @@ class TestInMemoryExampleEntityRepository:
 
         assert result is False
 
+    def test_contains(
+        self,
+        repository: ExampleEntityRepository,
+        sample_entity: ExampleEntity,
+    ) -> None:
+        """Should support the `in` operator as an alias for exists().
+
+        Note: __contains__ is adapter-specific, not part of the protocol.
+        """
+        from uuid import uuid4
+
+        repository.save(sample_entity)
+
+        assert isinstance(repository, InMemoryExampleEntityRepository)
+        assert sample_entity.id in repository
+        assert uuid4() not in repository
+
+    def test_contains_non_uuid_is_false(
+        self,
+        repository: ExampleEntityRepository,
+        sample_entity: ExampleEntity,
+    ) -> None:
+        """Should return False, not raise, for values that are not UUIDs.
+
+        Note: __contains__ is adapter-specific, not part of the protocol.
+        """
+        repository.save(sample_entity)
+
+        assert isinstance(repository, InMemoryExampleEntityRepository)
+        assert sample_entity not in repository
+        assert sample_entity.id.int not in repository
+        assert None not in repository
+
     def test_clear(
         self,
         repository: ExampleEntityRepository,
@@ -172,3 +205,56 @@ class TestInMemoryExampleEntityRepository:
         assert found is not None
         assert found.name == "Updated Name"
         assert len(repository.find_all()) == 1
+
+    def test_find_all_reflects_changes_after_previous_call(
+        self,
+        repository: ExampleEntityRepository,
+        sample_entity: ExampleEntity,
+    ) -> None:
+        """Should not serve a stale result after the storage changes."""
+        assert repository.find_all() == []
+
+        repository.save(sample_entity)
+        assert repository.find_all() == [sample_entity]
+
+        repository.delete(sample_entity.id)
+        assert repository.find_all() == []
+
+    def test_find_all_returns_independent_lists(
+        self,
+        repository: ExampleEntityRepository,
+        sample_entity: ExampleEntity,
+    ) -> None:
+        """Should not let callers mutate the repository through the result."""
+        repository.save(sample_entity)
+
+        result = repository.find_all()
+        result.clear()
+
+        assert repository.find_all() == [sample_entity]
+
+    def test_save_many(
+        self,
+        repository: ExampleEntityRepository,
+    ) -> None:
+        """Should save all given entities in one call.
+
+        Note: save_many() is an adapter-specific method not part of the protocol.
+        """
+        entity1 = ExampleEntity.create(name="Entity 1")
+        entity2 = ExampleEntity.create(name="Entity 2")
+        assert repository.find_all() == []
+
+        # save_many() is adapter-specific, not part of the protocol
+        assert isinstance(repository, InMemoryExampleEntityRepository)
+        repository.save_many(iter([entity1, entity2]))
+
+        assert repository.find_by_id(entity1.id) is entity1
+        assert repository.find_by_id(entity2.id) is entity2
+        assert len(repository.find_all()) == 2
+
+    def test_has_no_instance_dict(self) -> None:
+        """Should use __slots__ instead of a per-instance __dict__."""
+        repository = InMemoryExampleEntityRepository()
+
+        assert not hasattr(repository, "__dict__")
@@ -0,0 +1,179 @@
+"""
+Unit tests for ExampleEntity.
+
+These tests verify the identity semantics of the entity (equality and
+hashing are based on the id alone, not on the other attributes), and the
+opt-in performance features: sequential ids and name interning.
+
+Uses BDD-style naming: given_<context>_when_<action>_then_<expected_outcome>
+"""
+
+from dataclasses import asdict, fields
+from enum import StrEnum
+from uuid import uuid4
+
+import pytest
+
+from example_app.domain.models.example_entity import ExampleEntity
+
+
+@pytest.mark.unit
+class TestExampleEntity:
+    """Unit tests for the ExampleEntity domain model."""
+
+    def test_given_same_id_when_compared_then_entities_are_equal(self) -> None:
+        # Given
+        entity_id = uuid4()
+        first = ExampleEntity(id=entity_id, name="First")
+        second = ExampleEntity(id=entity_id, name="Second")
+
+        # When / Then
+        assert first == second
+        assert hash(first) == hash(second)
+
+    def test_given_entity_when_hashed_then_hash_matches_id_hash(self) -> None:
+        # Given
+        entity = ExampleEntity.create(name="Test")
+
+        # When
+        result = hash(entity)
+
+        # Then
+        assert result == hash(entity.id)
+
+    def test_given_entity_when_name_updated_then_identity_is_preserved(
+        self,
+    ) -> None:
+        # Given
+        entity = ExampleEntity.create(name="Original", description="Desc")
+
+        # When
+        updated = entity.update_name("Updated")
+
+        # Then
+        assert updated == entity
+        assert hash(updated) == hash(entity)
+        assert updated.name == "Updated"
+        assert updated.description == "Desc"
+        assert entity.name == "Original"
+
+    def test_given_entity_when_id_reassigned_then_hash_follows_id(self) -> None:
+        # Given
+        first = ExampleEntity.create(name="First")
+        second = ExampleEntity.create(name="Second")
+        hash(second)
+
+        # When
+        second.id = first.id
+
+        # Then
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+    def test_given_entity_when_converted_then_cached_hash_is_not_a_field(
+        self,
+    ) -> None:
+        # Given
+        entity = ExampleEntity.create(name="Test", description="Desc")
+
+        # When
+        field_names = [f.name for f in fields(entity)]
+        data = asdict(entity)
+
+        # Then
+        assert field_names == ["id", "name", "description"]
+        assert data == {"id": entity.id, "name": "Test", "description": "Desc"}
+
+    def test_given_entity_when_repr_then_cached_hash_is_hidden(self) -> None:
+        # Given
+        entity = ExampleEntity.create(name="Test")
+
+        # When
+        result = repr(entity)
+
+        # Then
+        assert "_hash" not in result
+        assert "name='Test'" in result
+
+    def test_given_sequential_ids_when_create_then_ids_are_consecutive(
+        self,
+    ) -> None:
+        # Given
+        ExampleEntity.use_sequential_ids(start=10)
+
+        try:
+            # When
+            first = ExampleEntity.create(name="First")
+            second = ExampleEntity.create(name="Second")
+        finally:
+            ExampleEntity.use_random_ids()
+
+        # Then
+        assert first.id.int == 10
+        assert second.id.int == 11
+        assert ExampleEntity.create(name="Random").id.version == 4
+
+    def test_given_interned_names_when_created_then_name_is_shared(
+        self,
+    ) -> None:
+        # Given
+        words = ["Shared", "name"]
+        first_name = " ".join(words)
+        second_name = " ".join(words)
+        assert first_name is not second_name
+        ExampleEntity.use_interned_names()
+
+        try:
+            # When
+            first = ExampleEntity.create(name=first_name)
+            second = ExampleEntity.create(name=second_name)
+        finally:
+            ExampleEntity.use_interned_names(enabled=False)
+
+        # Then
+        assert first.name is second.name
+
+    def test_given_interned_names_when_name_is_str_subclass_then_kept_as_is(
+        self,
+    ) -> None:
+        # Given
+        class Kind(StrEnum):
+            X = "x"
+
+        ExampleEntity.use_interned_names()
+
+        try:
+            # When
+            entity = ExampleEntity.create(name=Kind.X)
+        finally:
+            ExampleEntity.use_interned_names(enabled=False)
+
+        # Then
+        assert entity.name is Kind.X
+
+    def test_given_sequential_ids_toggled_when_create_then_ids_are_not_reissued(
+        self,
+    ) -> None:
+        # Given
+        ExampleEntity.use_sequential_ids()
+        try:
+            first = ExampleEntity.create(name="First")
+            ExampleEntity.use_random_ids()
+            ExampleEntity.use_sequential_ids()
+
+            # When
+            second = ExampleEntity.create(name="Second")
+        finally:
+            ExampleEntity.use_random_ids()
+
+        # Then
+        assert second.id.int == first.id.int + 1
+
+    def test_given_negative_start_when_use_sequential_ids_then_raises_value_error(
+        self,
+    ) -> None:
+        # When / Then
+        with pytest.raises(ValueError):
+            ExampleEntity.use_sequential_ids(start=-1)
+        assert ExampleEntity.create(name="Random").id.version == 4
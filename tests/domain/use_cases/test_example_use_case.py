@@ -10,6 +10,7 @@ no inheritance required.
 Uses BDD-style naming: given_<context>_when_<action>_then_<expected_outcome>
 """
 
+from collections.abc import Iterator
 from uuid import UUID
 
 import pytest
@@ -17,6 +18,8 @@ import pytest
 from example_app.domain.models.example_entity import ExampleEntity
 from example_app.domain.ports.repository import ExampleEntityRepository
 
+_MISSING = object()
+
 
 class FakeExampleEntityRepository:
     """Fake repository for testing use cases in isolation.
@@ -25,70 +28,57 @@ class FakeExampleEntityRepository:
     protocol through structural typing (duck typing with type safety).
     """
 
+    __slots__ = ("_storage",)
+
     def __init__(self) -> None:
-        self._storage: dict[UUID, ExampleEntity] = {}
+        self._storage: dict[int, ExampleEntity] = {}
 
     def save(self, entity: ExampleEntity) -> ExampleEntity:
-        self._storage[entity.id] = entity
+        self._storage[entity.id.int] = entity
         return entity
 
     def find_by_id(self, entity_id: UUID) -> ExampleEntity | None:
-        return self._storage.get(entity_id)
+        return self._storage.get(entity_id.int)
 
     def find_all(self) -> list[ExampleEntity]:
         return list(self._storage.values())
 
     def delete(self, entity_id: UUID) -> bool:
-        if entity_id in self._storage:
-            del self._storage[entity_id]
-            return True
-        return False
+        return self._storage.pop(entity_id.int, _MISSING) is not _MISSING
 
     def exists(self, entity_id: UUID) -> bool:
-        return entity_id in self._storage
+        return entity_id.int in self._storage
+
+    def clear(self) -> None:
+        """Test helper, not part of the protocol: reset the fake between tests."""
+        self._storage.clear()
+
+
+@pytest.fixture(scope="module")
+def shared_fake_repository() -> FakeExampleEntityRepository:
+    """Provide a single fake repository instance for the whole module."""
+    return FakeExampleEntityRepository()
 
 
 @pytest.fixture
-def fake_repository() -> ExampleEntityRepository:
+def fake_repository(
+    shared_fake_repository: FakeExampleEntityRepository,
+) -> Iterator[ExampleEntityRepository]:
     """Provide a fake repository for testing.
 
     Return type is the Protocol, not the fake class.
     This ensures the fake satisfies the protocol contract.
+
+    The instance is shared across the module and emptied after each test,
+    so tests stay isolated without rebuilding the fake every time.
     """
-    return FakeExampleEntityRepository()
+    yield shared_fake_repository
+    shared_fake_repository.clear()
 
 
 @pytest.mark.unit
 class TestExampleUseCase:
-    """Unit tests for ExampleUseCase.
-
-    Example of what real use case tests might look like:
-
-    def test_given_valid_input_when_create_entity_then_entity_is_persisted(
-        self, fake_repository: ExampleEntityRepository
-    ) -> None:
-        # Given
-        use_case = CreateEntityUseCase(repository=fake_repository)
-        input_data = CreateEntityInput(name="Test", description="A test entity")
-
-        # When
-        result = use_case.execute(input_data)
-
-        # Then
-        assert result.id is not None
-        assert fake_repository.exists(result.id)
-
-    def test_given_empty_name_when_create_entity_then_raises_validation_error(
-        self, fake_repository: ExampleEntityRepository
-    ) -> None:
-        # Given
-        use_case = CreateEntityUseCase(repository=fake_repository)
-        input_data = CreateEntityInput(name="", description="Invalid entity")
-
-        # When / Then
-        with pytest.raises(ValidationError):
-            use_case.execute(input_data)
-    """
+    """Unit tests for ExampleUseCase."""
 
     def test_given_fake_repository_when_initialized_then_repository_is_available(
         self, fake_repository: ExampleEntityRepository